@@ -17,8 +17,7 @@ Date: July 3, 2025
 
 import sys
 import time
-import psutil
-import json
+import threading
 import os
 from PyQt5.QtWidgets import (
     QApplication,
@@ -30,6 +29,7 @@ from PyQt5.QtWidgets import (
     QSystemTrayIcon,
     QMenu,
     QAction,
+    QWIDGETSIZE_MAX,
 )
 from PyQt5.QtCore import (
     Qt,
@@ -37,63 +37,158 @@ from PyQt5.QtCore import (
     QPropertyAnimation,
     QEasingCurve,
     QRect,
-    QRectF,
     pyqtSignal,
     QPoint,
     QSize,
     QEvent,
+    QThread,
+    QElapsedTimer,
 )
 from PyQt5.QtGui import (
     QFont,
-    QPalette,
     QColor,
-    QIcon,
     QPainter,
     QBrush,
     QCursor,
     QPen,
-    QPainterPath,
 )
 
+# Position file I/O: use orjson when available, compact stdlib json otherwise
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+# Bytes to megabits conversion factor
+_BITS_PER_BYTE_PER_MB = 8 / (1024 * 1024)
+
+
+def _format_speed(speed_mbps):
+    """Format a speed in Mbps for display"""
+    if speed_mbps >= 1.0:
+        return f"{speed_mbps:.2f} Mbps"
+    return f"{speed_mbps * 1024:.1f} Kbps"
+
+
+# Resize cursor per zone index: bit 0 = left, 1 = right, 2 = top, 3 = bottom.
+# Corners take priority over edges, and left/top over right/bottom.
+_ZONE_TABLE = (
+    None,  # Inside
+    Qt.SizeHorCursor,  # Left edge (↔)
+    Qt.SizeHorCursor,  # Right edge (↔)
+    Qt.SizeHorCursor,  # Left + right
+    Qt.SizeVerCursor,  # Top edge (↕)
+    Qt.SizeFDiagCursor,  # Top-left (↖)
+    Qt.SizeBDiagCursor,  # Top-right (↗)
+    Qt.SizeFDiagCursor,  # Top + left + right
+    Qt.SizeVerCursor,  # Bottom edge (↕)
+    Qt.SizeBDiagCursor,  # Bottom-left (↙)
+    Qt.SizeFDiagCursor,  # Bottom-right (↘)
+    Qt.SizeBDiagCursor,  # Bottom + left + right
+    Qt.SizeVerCursor,  # Top + bottom
+    Qt.SizeFDiagCursor,  # Top + bottom + left
+    Qt.SizeBDiagCursor,  # Top + bottom + right
+    Qt.SizeFDiagCursor,  # All four
+)
+
+# Shared QCursor instances keyed on cursor shape, filled on first use
+_CURSOR_CACHE = {}
+
+# Widget state flags packed into UnifiedNetworkWidget._state_bits so event
+# handlers can test several of them with one integer compare
+_EXPANDED = 1
+_DRAGGING = 2
+_RESIZING = 4
+_HOVER_ENABLED = 8
+_STATE_MASK = _EXPANDED | _DRAGGING | _RESIZING | _HOVER_ENABLED
+_HOVER_CURSOR_MASK = _EXPANDED | _DRAGGING | _RESIZING
+
 
 class NetworkMonitor:
-    """Network monitoring utility using psutil"""
+    """Network monitoring utility using /proc/net/dev on Linux, psutil elsewhere"""
 
     def __init__(self):
+        self._proc_net_dev = None
+        if sys.platform.startswith("linux"):
+            try:
+                # Kept open and rewound for each sample instead of reopened
+                self._proc_net_dev = open("/proc/net/dev", "rb", buffering=0)
+            except OSError:
+                pass
+
+        # Bind hot-path callables once to skip attribute lookups per tick
+        if self._proc_net_dev is not None:
+            self._read_counters = self._read_proc_net_dev
+        else:
+            # psutil is imported lazily: the widget may idle collapsed for a
+            # whole session without ever needing it
+            import psutil
+
+            self._counters = psutil.net_io_counters
+            self._read_counters = self._read_psutil
+        self._monotonic = time.monotonic
         self.last_bytes_sent = 0
         self.last_bytes_recv = 0
-        self.last_time = time.time()
+        self.last_time = self._monotonic()
         self._initialize_network_stats()
 
     def _initialize_network_stats(self):
         """Initialize network statistics"""
         try:
-            stats = psutil.net_io_counters()
-            self.last_bytes_sent = stats.bytes_sent
-            self.last_bytes_recv = stats.bytes_recv
+            self.last_bytes_sent, self.last_bytes_recv = self._read_counters()
         except Exception:
             self.last_bytes_sent = 0
             self.last_bytes_recv = 0
 
+    def _read_psutil(self):
+        """Return total (bytes_sent, bytes_recv) across all interfaces via psutil"""
+        stats = self._counters(pernic=False)
+        return stats.bytes_sent, stats.bytes_recv
+
+    def _read_proc_net_dev(self):
+        """Return total (bytes_sent, bytes_recv) across all interfaces from procfs"""
+        self._proc_net_dev.seek(0)
+        data = self._proc_net_dev.read()
+
+        bytes_sent = 0
+        bytes_recv = 0
+        # Skip the two header lines; after "iface:" RX bytes is the first
+        # field and TX bytes the ninth (all interfaces summed, like psutil)
+        for line in data.splitlines()[2:]:
+            fields = line.partition(b":")[2].split()
+            bytes_recv += int(fields[0])
+            bytes_sent += int(fields[8])
+        return bytes_sent, bytes_recv
+
     def get_network_speed(self):
         """Get current network upload and download speeds"""
         try:
-            current_time = time.time()
-            stats = psutil.net_io_counters()
+            current_time = self._monotonic()
+            bytes_sent, bytes_recv = self._read_counters()
 
             time_diff = current_time - self.last_time
             if time_diff <= 0:
                 return 0.0, 0.0
 
-            bytes_sent_diff = stats.bytes_sent - self.last_bytes_sent
-            bytes_recv_diff = stats.bytes_recv - self.last_bytes_recv
+            # Clamp at zero: an interface that is recreated under the same
+            # name (e.g. a VPN tun device) resets its counters
+            bytes_sent_diff = max(0, bytes_sent - self.last_bytes_sent)
+            bytes_recv_diff = max(0, bytes_recv - self.last_bytes_recv)
 
             # Convert to Mbps
-            upload_speed = (bytes_sent_diff / time_diff) * 8 / (1024 * 1024)
-            download_speed = (bytes_recv_diff / time_diff) * 8 / (1024 * 1024)
+            upload_speed = bytes_sent_diff * _BITS_PER_BYTE_PER_MB / time_diff
+            download_speed = bytes_recv_diff * _BITS_PER_BYTE_PER_MB / time_diff
 
-            self.last_bytes_sent = stats.bytes_sent
-            self.last_bytes_recv = stats.bytes_recv
+            self.last_bytes_sent = bytes_sent
+            self.last_bytes_recv = bytes_recv
             self.last_time = current_time
 
             return upload_speed, download_speed
@@ -105,58 +200,116 @@ class NetworkMonitor:
     @staticmethod
     def format_speed(speed_mbps):
         """Format speed for display"""
-        if speed_mbps >= 1.0:
-            return f"{speed_mbps:.2f} Mbps"
-        else:
-            speed_kbps = speed_mbps * 1024
-            return f"{speed_kbps:.1f} Kbps"
+        return _format_speed(speed_mbps)
+
 
+class _NetSampler(QThread):
+    """Background sampler that emits network speeds only when they change"""
 
-class GlobalClickFilter(QWidget):
-    """Global event filter to detect clicks/touches anywhere on screen"""
+    sample = pyqtSignal(float, float)
 
-    def __init__(self, network_widget):
+    # Minimum change (in Mbps) worth repainting for: 1 Kbps
+    CHANGE_THRESHOLD = 1.0 / 1024
+
+    def __init__(self, monitor, interval_ms=1000):
         super().__init__()
-        self.network_widget = network_widget
-
-    def eventFilter(self, obj, event):
-        """Filter all mouse press and touch events across the entire screen"""
-        # Handle mouse clicks
-        if event.type() == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
-            if self.network_widget.is_expanded:
-                # Get the global position of the click
-                click_pos = event.globalPos()
-
-                # Get our widget's global geometry
-                widget_rect = self.network_widget.geometry()
-
-                # If the click is outside our widget area, collapse immediately
-                if not widget_rect.contains(click_pos):
-                    QTimer.singleShot(50, self.network_widget.collapse_widget)
-                else:
-                    # Click inside widget - reset the auto-collapse timer
-                    self.network_widget.reset_auto_collapse_timer()
+        self.monitor = monitor
+        self.interval = interval_ms / 1000
+        self._stop_event = threading.Event()
+        self._last_upload = None
+        self._last_download = None
 
-        # Handle touch events (for touchscreen support)
-        elif event.type() == QEvent.TouchBegin:
-            if self.network_widget.is_expanded:
-                # For touch events, collapse on any touch outside the widget
-                touch_points = event.touchPoints()
-                if touch_points:
-                    touch_pos = touch_points[0].screenPos().toPoint()
-                    widget_rect = self.network_widget.geometry()
+    def run(self):
+        """Sample once per interval until stopped, emitting only on change"""
+        while not self._stop_event.wait(self.interval):
+            upload_speed, download_speed = self.monitor.get_network_speed()
 
-                    if not widget_rect.contains(touch_pos):
-                        QTimer.singleShot(50, self.network_widget.collapse_widget)
-                    else:
-                        self.network_widget.reset_auto_collapse_timer()
+            if (
+                self._last_upload is None
+                or abs(upload_speed - self._last_upload) > self.CHANGE_THRESHOLD
+                or abs(download_speed - self._last_download) > self.CHANGE_THRESHOLD
+            ):
+                self._last_upload = upload_speed
+                self._last_download = download_speed
+                self.sample.emit(upload_speed, download_speed)
 
-        return False  # Always pass the event through
+    def start(self):
+        """Start sampling (no-op if already running)"""
+        if self.isRunning():
+            return
+        self._stop_event.clear()
+        self._last_upload = None
+        self._last_download = None
+        super().start()
+
+    def stop(self):
+        """Stop sampling and wait for the thread to finish"""
+        if not self.isRunning():
+            return
+        self._stop_event.set()
+        self.wait()
+
+
+def _build_inner_widget_styles():
+    """Return the inner widget stylesheets keyed on (is_expanded, is_on_right)"""
+    # Expanded panel - edge-specific rounding with solid background
+    expanded_style = """
+        QWidget#inner_widget {{
+            background-color: rgb(55, 55, 55);
+            border: 2px solid rgb(100, 100, 100);
+            {border_radius}
+        }}
+        QWidget#inner_widget:hover {{
+            background-color: rgb(70, 70, 70);
+        }}
+        QLabel {{
+            color: #C0C0C0;
+            background-color: transparent;
+        }}
+        QFrame {{
+            color: rgba(120, 120, 120, 150);
+        }}
+    """
+
+    # Collapsed widget - transparent background with border, dots and border same color
+    collapsed_style = """
+        QWidget#inner_widget {
+            background-color: transparent;
+            border: 1px solid rgba(120, 120, 120, 180);
+            border-radius: 6px;
+        }
+        QLabel {
+            color: #C0C0C0;
+            background-color: transparent;
+        }
+        QFrame {
+            color: rgba(120, 120, 120, 150);
+        }
+    """
+
+    return {
+        # Right edge: round left corners, square right corners
+        (True, True): expanded_style.format(
+            border_radius="border-top-left-radius: 12px; border-bottom-left-radius: 12px; border-top-right-radius: 0px; border-bottom-right-radius: 0px;"
+        ),
+        # Left edge: round right corners, square left corners
+        (True, False): expanded_style.format(
+            border_radius="border-top-right-radius: 12px; border-bottom-right-radius: 12px; border-top-left-radius: 0px; border-bottom-left-radius: 0px;"
+        ),
+        (False, True): collapsed_style,
+        (False, False): collapsed_style,
+    }
 
 
 class UnifiedNetworkWidget(QWidget):
     """Unified widget that combines edge widget and expandable panel"""
 
+    # Inner widget stylesheets keyed on (is_expanded, is_on_right), built once
+    _STYLES = _build_inner_widget_styles()
+
+    # Shared QFont instances keyed on (point_size, bold)
+    _font_cache = {}
+
     def __init__(self):
         super().__init__()
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
@@ -165,10 +318,13 @@ class UnifiedNetworkWidget(QWidget):
         )  # Keep outer container transparent
         self.setAttribute(Qt.WA_AcceptTouchEvents)  # Enable touch events
 
-        # Screen dimensions
-        screen = QApplication.primaryScreen().geometry()
-        self.screen_width = screen.width()
-        self.screen_height = screen.height()
+        # Application instance, looked up once
+        self._app = QApplication.instance()
+
+        # Screen dimensions (refreshed on resolution and primary screen changes)
+        self._screen = None
+        self._refresh_screen()
+        self._app.primaryScreenChanged.connect(self._refresh_screen)
 
         # Widget dimensions (default and minimum sizes)
         self.widget_width = 12
@@ -181,44 +337,80 @@ class UnifiedNetworkWidget(QWidget):
         self.max_panel_height = 400
 
         # State variables
+        self._state_bits = 0  # Packed copy of the flags below, see update_state_bits
         self.is_expanded = False
         self.is_on_right = True
         self.dragging = False
         self.resizing = False
         self.drag_threshold = 5
         self.resize_threshold = 8
+        self._zone_right = 0  # Right/bottom resize-zone bounds, set by resizeEvent
+        self._zone_bottom = 0
         self.mouse_press_position = QPoint()
         self.drag_start_position = QPoint()
-        self.resize_start_position = QPoint()
         self.resize_start_size = QSize()
-
-        # Network monitor (only created when needed)
+        self._last_qss = None  # Stylesheet currently applied to inner_widget
+
+        # Hover cursor updates are throttled to ~60 Hz and applied only on change
+        self._cursor_et = QElapsedTimer()
+        self._cursor_et.start()
+        self._last_cursor_shape = None
+
+        # Trailing re-check for moves dropped by the throttle, so the cursor
+        # always matches where the pointer comes to rest
+        self._pending_cursor_pos = None
+        self._cursor_timer = QTimer()
+        self._cursor_timer.setSingleShot(True)
+        self._cursor_timer.timeout.connect(self._apply_pending_cursor)
+
+        # Collapsed indicator dots: same color as border with 70% opacity
+        dot_color = QColor(120, 120, 120, 180)
+        self._dot_brush = QBrush(dot_color)
+        self._dot_pen = QPen(dot_color, 1)
+        self._dot_size = 2
+        self._dot_positions = []
+
+        # Network monitor and its background sampler (created at first idle moment)
         self.network_monitor = None
+        self.network_sampler = None
+        QTimer.singleShot(0, self._prewarm_monitor)
 
         # UI setup
+        self._ui_ready = False  # Set once setup_ui has created all labels
+        self._title_font_key = None  # Font keys currently applied to labels
+        self._label_font_key = None
+        self._speed_font_key = None
         self.setup_ui()
         self.setup_styling()
 
         # Timers
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_network_speeds)
-
-        # Auto-collapse timer (10 seconds after hover)
-        self.auto_collapse_timer = QTimer()
-        self.auto_collapse_timer.setSingleShot(True)
-        self.auto_collapse_timer.timeout.connect(self.collapse_widget)
-
-        self.hide_timer = QTimer()
-        self.hide_timer.setSingleShot(True)
-        self.hide_timer.timeout.connect(self.collapse_widget)
-
-        # Hover delay timer (10 seconds after leaving hover)
-        self.hover_delay_timer = QTimer()
-        self.hover_delay_timer.setSingleShot(True)
-        self.hover_delay_timer.timeout.connect(self.collapse_widget)
+        # Position save timer (coalesces bursts of saves into one write)
+        self._position_dirty = False
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setTimerType(Qt.CoarseTimer)
+        self._save_timer.timeout.connect(self._flush_position)
+        self._app.aboutToQuit.connect(self._flush_position)
+
+        # Collapse timer shared by auto-collapse (10 seconds after interaction)
+        # and hover delay (10 seconds after leaving hover)
+        self._collapse_deadline = None  # time.monotonic() at which to collapse
+        self._collapse_timer = QTimer()
+        self._collapse_timer.setSingleShot(True)
+        self._collapse_timer.setTimerType(Qt.CoarseTimer)
+        self._collapse_timer.timeout.connect(self._on_collapse_timeout)
+
+        # Resize throttle (at most one geometry update per ~16ms frame)
+        self._pending_geometry = None
+        self._last_applied_geometry = None
+        self._resize_throttle = QTimer()
+        self._resize_throttle.setSingleShot(True)
+        self._resize_throttle.setInterval(16)
+        self._resize_throttle.timeout.connect(self._flush_pending_resize)
 
         self.launch_timer = QTimer()
         self.launch_timer.setSingleShot(True)
+        self.launch_timer.setTimerType(Qt.CoarseTimer)
         self.launch_timer.timeout.connect(self.initial_collapse)
 
         # Position widget initially
@@ -235,6 +427,10 @@ class UnifiedNetworkWidget(QWidget):
         # Enable mouse tracking for hover events
         self.setMouseTracking(True)
 
+        # Collapse on outside clicks: another window taking focus means the
+        # user clicked away from the panel
+        self._app.focusWindowChanged.connect(self._on_focus_window_changed)
+
         # Show launch animation
         self.show_launch_animation()
 
@@ -269,7 +465,6 @@ class UnifiedNetworkWidget(QWidget):
         title_container.setSpacing(5)
 
         self.title_label = QLabel("Network Speed Monitor")
-        self.update_title_font()
         self.title_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         self.title_label.setWordWrap(False)
         self.title_label.setSizePolicy(
@@ -282,6 +477,7 @@ class UnifiedNetworkWidget(QWidget):
         self.toggle_button.setFixedSize(16, 16)
         self.toggle_button.setAlignment(Qt.AlignCenter)
         self.hover_expand_enabled = True  # Default: hover expand enabled
+        self.update_state_bits()
         self.update_toggle_button_style()
         self.toggle_button.setCursor(QCursor(Qt.PointingHandCursor))
         self.toggle_button.mousePressEvent = self.toggle_hover_expand
@@ -358,11 +554,13 @@ class UnifiedNetworkWidget(QWidget):
         panel_layout.addLayout(speed_layout)
 
         self.panel_content.setLayout(panel_layout)
-        self.panel_content.hide()  # Initially hidden
+        self.panel_content.setMaximumSize(0, 0)  # Initially collapsed to nothing
 
         layout.addWidget(self.panel_content)
 
         # Update fonts after all labels are created
+        self._ui_ready = True
+        self.update_title_font()
         self.update_label_fonts()
 
     def setup_styling(self):
@@ -370,17 +568,23 @@ class UnifiedNetworkWidget(QWidget):
         # Set initial styling for inner widget
         self.update_inner_widget_style()
 
-        # Style speed labels with colors
-        self.upload_speed_label.setStyleSheet(
-            "color: #4CAF50; background-color: transparent;"
-        )
-        self.download_speed_label.setStyleSheet(
-            "color: #2196F3; background-color: transparent;"
-        )
-        self.title_label.setStyleSheet("color: #B0B0B0; background-color: transparent;")
+        # Style speed labels with colors (batched into a single repaint)
+        self.inner_widget.setUpdatesEnabled(False)
+        try:
+            self.upload_speed_label.setStyleSheet(
+                "color: #4CAF50; background-color: transparent;"
+            )
+            self.download_speed_label.setStyleSheet(
+                "color: #2196F3; background-color: transparent;"
+            )
+            self.title_label.setStyleSheet(
+                "color: #B0B0B0; background-color: transparent;"
+            )
+        finally:
+            self.inner_widget.setUpdatesEnabled(True)
 
         # Set cursor
-        self.setCursor(QCursor(Qt.PointingHandCursor))
+        self.set_cursor_shape(Qt.PointingHandCursor)
 
         # Position settings file
         self.position_file = os.path.join(
@@ -390,33 +594,85 @@ class UnifiedNetworkWidget(QWidget):
     def set_collapsed_state(self):
         """Set widget to collapsed state"""
         self.is_expanded = False
+        self.update_state_bits()
         self.setFixedSize(self.widget_width, self.widget_height)
-        self.panel_content.hide()
+        # Squeeze the panel instead of hiding it so its layout stays intact
+        self.panel_content.setMaximumSize(0, 0)
+        self.update_dot_positions()
 
         # Update styling for collapsed state
         self.update_inner_widget_style()
 
         # Stop network monitoring
-        if self.update_timer.isActive():
-            self.update_timer.stop()
+        self.update_sampling_state()
 
     def set_expanded_state(self):
         """Set widget to expanded state"""
         self.is_expanded = True
+        self.update_state_bits()
         self.setFixedSize(self.panel_width, self.panel_height)
-        self.panel_content.show()
+        self.panel_content.setMaximumSize(QWIDGETSIZE_MAX, QWIDGETSIZE_MAX)
 
         # Update styling for expanded state
         self.update_inner_widget_style()
 
-        # Update fonts to match current size
-        self.update_title_font()
-        self.update_label_fonts()
-
         # Start network monitoring
-        if not self.network_monitor:
-            self.network_monitor = NetworkMonitor()
-        self.update_timer.start(1000)  # Update every 1000ms (1 second) instead of 500ms
+        self.update_sampling_state()
+
+    def _prewarm_monitor(self):
+        """Create the network monitor and sampler off the first-expand path"""
+        if self.network_monitor:
+            return
+
+        self.network_monitor = NetworkMonitor()
+        self.network_sampler = _NetSampler(self.network_monitor)
+        self.network_sampler.sample.connect(self.update_network_speeds)
+        self._app.aboutToQuit.connect(self.network_sampler.stop)
+
+        # The launch animation expands the widget before the event loop starts
+        self.update_sampling_state()
+
+    def update_sampling_state(self):
+        """Run the network sampler only while the expanded panel can be seen"""
+        if not self.network_sampler:
+            return
+
+        if self.is_expanded and self.isVisible() and not self.isMinimized():
+            self.network_sampler.start()  # Samples every second, emits only on change
+        else:
+            self.network_sampler.stop()
+
+    def showEvent(self, event):
+        """Resume network sampling when the widget is shown"""
+        super().showEvent(event)
+        self.update_sampling_state()
+
+    def hideEvent(self, event):
+        """Pause network sampling while the widget is hidden"""
+        super().hideEvent(event)
+        self.update_sampling_state()
+
+    def changeEvent(self, event):
+        """Pause network sampling while the widget is minimized"""
+        if event.type() == QEvent.WindowStateChange:
+            self.update_sampling_state()
+        super().changeEvent(event)
+
+    def _refresh_screen(self, *args):
+        """Re-read primary screen dimensions and follow its geometry changes"""
+        screen = self._app.primaryScreen()
+        if screen is not self._screen:
+            if self._screen is not None:
+                try:
+                    self._screen.geometryChanged.disconnect(self._refresh_screen)
+                except (TypeError, RuntimeError):
+                    pass  # Not connected, or the old screen was unplugged
+            screen.geometryChanged.connect(self._refresh_screen)
+            self._screen = screen
+
+        geometry = screen.geometry()
+        self.screen_width = geometry.width()
+        self.screen_height = geometry.height()
 
     def position_widget(self):
         """Position widget based on current state and edge"""
@@ -452,7 +708,16 @@ class UnifiedNetworkWidget(QWidget):
         self.move(x, y)
 
     def save_position(self):
-        """Save current widget position, size, state, and preferences to file"""
+        """Schedule a save of the widget position; bursts are written once"""
+        self._position_dirty = True
+        self._save_timer.start(2000)  # 2 seconds after the last change
+
+    def _flush_position(self):
+        """Write current widget position, size, state, and preferences to file"""
+        self._save_timer.stop()
+        if not self._position_dirty:
+            return
+
         try:
             position_data = {
                 "x": self.x(),
@@ -464,8 +729,12 @@ class UnifiedNetworkWidget(QWidget):
                 "hover_expand_enabled": self.hover_expand_enabled,
             }
 
-            with open(self.position_file, "w") as f:
-                json.dump(position_data, f)
+            # Write to a temp file and swap it in so a crash can't corrupt the JSON
+            temp_file = self.position_file + ".tmp"
+            with open(temp_file, "wb") as f:
+                f.write(_dumps(position_data))
+            os.replace(temp_file, self.position_file)
+            self._position_dirty = False
 
         except Exception as e:
             print(f"Error saving position: {e}")
@@ -474,8 +743,8 @@ class UnifiedNetworkWidget(QWidget):
         """Load widget position, size, state, and preferences from file"""
         try:
             if os.path.exists(self.position_file):
-                with open(self.position_file, "r") as f:
-                    position_data = json.load(f)
+                with open(self.position_file, "rb") as f:
+                    position_data = _loads(f.read())
 
                 # Restore edge preference
                 self.is_on_right = position_data.get("is_on_right", True)
@@ -484,6 +753,7 @@ class UnifiedNetworkWidget(QWidget):
                 self.hover_expand_enabled = position_data.get(
                     "hover_expand_enabled", True
                 )
+                self.update_state_bits()
 
                 # Restore panel size with bounds checking
                 saved_width = position_data.get("width", self.panel_width)
@@ -518,7 +788,7 @@ class UnifiedNetworkWidget(QWidget):
                 self.update_inner_widget_style()
 
                 # Update toggle button style after loading preference
-                if hasattr(self, "toggle_button"):
+                if self._ui_ready:
                     self.update_toggle_button_style()
 
             else:
@@ -530,39 +800,41 @@ class UnifiedNetworkWidget(QWidget):
             # Fall back to default positioning
             self.position_widget()
 
+    def update_dot_positions(self):
+        """Calculate indicator dot positions for the collapsed widget size"""
+        dot_size = self._dot_size
+        spacing = 6
+        start_y = (self.widget_height - (3 * dot_size + 2 * spacing)) // 2
+        x = self.widget_width // 2 - dot_size // 2
+
+        self._dot_positions = [
+            (x, start_y + i * (dot_size + spacing)) for i in range(3)
+        ]
+
     def paintEvent(self, event):
         """Custom paint event - draw indicator dots for collapsed state"""
         if not self.is_expanded:
-            # Draw dots with same color as border and 70% opacity
             painter = QPainter(self)
             painter.setRenderHint(QPainter.Antialiasing)
+            painter.setBrush(self._dot_brush)
+            painter.setPen(self._dot_pen)
 
-            # Calculate dot positions
-            dot_size = 2
-            spacing = 6
-            start_y = (self.height() - (3 * dot_size + 2 * spacing)) // 2
-
-            # Use same color as border with 70% opacity (120, 120, 120, 180)
-            dot_color = QColor(120, 120, 120, 180)  # 70% opacity
-
-            for i in range(3):
-                y = start_y + i * (dot_size + spacing)
-                x = self.width() // 2 - dot_size // 2
-
-                # Draw the dot with same color as border
-                painter.setBrush(QBrush(dot_color))
-                painter.setPen(QPen(dot_color, 1))
+            dot_size = self._dot_size
+            for x, y in self._dot_positions:
                 painter.drawEllipse(x, y, dot_size, dot_size)
 
     def mousePressEvent(self, event):
         """Handle mouse press for dragging and resizing"""
         if event.button() == Qt.LeftButton:
             self.mouse_press_position = event.globalPos()
+            self._press_x = event.globalX()
+            self._press_y = event.globalY()
             self.drag_start_position = (
                 event.globalPos() - self.frameGeometry().topLeft()
             )
             self.dragging = False
             self.resizing = False
+            self.update_state_bits()
 
             # Check if we're in a resize zone when expanded
             if self.is_expanded:
@@ -573,7 +845,7 @@ class UnifiedNetworkWidget(QWidget):
                     return
                 else:
                     # Reset auto-collapse timer on interaction
-                    self.reset_auto_collapse_timer()
+                    self.schedule_collapse(10000)
 
     def mouseMoveEvent(self, event):
         """Handle mouse move for dragging, resizing, and cursor updates"""
@@ -585,13 +857,13 @@ class UnifiedNetworkWidget(QWidget):
 
             # Check if we should start dragging
             if not self.dragging and not self.resizing:
-                move_distance = (
-                    event.globalPos() - self.mouse_press_position
-                ).manhattanLength()
-                if move_distance > self.drag_threshold:
+                dx = event.globalX() - self._press_x
+                dy = event.globalY() - self._press_y
+                if dx * dx + dy * dy > self.drag_threshold * self.drag_threshold:
                     self.dragging = True
-                    self.setCursor(QCursor(Qt.SizeAllCursor))
-                    self.stop_auto_collapse_timer()  # Stop auto-collapse during drag
+                    self.update_state_bits()
+                    self.set_cursor_shape(Qt.SizeAllCursor)
+                    self.cancel_collapse()  # Stop auto-collapse during drag
 
             # Drag the entire widget (collapsed or expanded)
             if self.dragging:
@@ -599,13 +871,57 @@ class UnifiedNetworkWidget(QWidget):
                 self.move(new_pos)
         else:
             # Update cursor based on mouse position when expanded
-            if self.is_expanded and not self.dragging and not self.resizing:
-                local_pos = event.pos()
-                resize_cursor = self.get_resize_cursor_zone(local_pos)
-                if resize_cursor:
-                    self.setCursor(QCursor(resize_cursor))
-                else:
-                    self.setCursor(QCursor(Qt.PointingHandCursor))
+            if (self._state_bits & _HOVER_CURSOR_MASK) == _EXPANDED:
+                elapsed = self._cursor_et.elapsed()
+                if elapsed < 16:
+                    # Remember the latest position and re-check it when the
+                    # throttle window expires
+                    self._pending_cursor_pos = event.pos()
+                    if not self._cursor_timer.isActive():
+                        self._cursor_timer.start(16 - elapsed)
+                    return
+
+                self._cursor_timer.stop()
+                self._pending_cursor_pos = None
+                self.update_hover_cursor(event.pos())
+
+    def update_hover_cursor(self, local_pos):
+        """Show the resize cursor for the zone under local_pos"""
+        self._cursor_et.restart()
+        self.set_cursor_shape(
+            self.get_resize_cursor_zone(local_pos) or Qt.PointingHandCursor
+        )
+
+    def _apply_pending_cursor(self):
+        """Apply the last hover position dropped by the cursor throttle"""
+        local_pos = self._pending_cursor_pos
+        self._pending_cursor_pos = None
+        if local_pos is None:
+            return
+
+        # A drag, resize or collapse may have started since the move
+        if (self._state_bits & _HOVER_CURSOR_MASK) == _EXPANDED:
+            self.update_hover_cursor(local_pos)
+
+    def update_state_bits(self):
+        """Repack the state flags into _state_bits (call after changing one)"""
+        self._state_bits = (
+            (_EXPANDED if self.is_expanded else 0)
+            | (_DRAGGING if self.dragging else 0)
+            | (_RESIZING if self.resizing else 0)
+            | (_HOVER_ENABLED if self.hover_expand_enabled else 0)
+        )
+
+    def set_cursor_shape(self, shape):
+        """Apply a shared QCursor for shape, skipping no-op changes"""
+        if shape == self._last_cursor_shape:
+            return
+
+        cursor = _CURSOR_CACHE.get(shape)
+        if cursor is None:
+            cursor = _CURSOR_CACHE[shape] = QCursor(shape)
+        self.setCursor(cursor)
+        self._last_cursor_shape = shape
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release"""
@@ -615,9 +931,10 @@ class UnifiedNetworkWidget(QWidget):
                 self.finish_resize()
             elif self.dragging:
                 # We were dragging - snap to edge and maintain state
-                self.setCursor(QCursor(Qt.PointingHandCursor))
+                self.set_cursor_shape(Qt.PointingHandCursor)
                 self.snap_to_edge()
                 self.dragging = False
+                self.update_state_bits()
                 # No need to restart auto-collapse timer since we use hover
                 # Position will be saved automatically by animate_to_edge
             else:
@@ -696,24 +1013,19 @@ class UnifiedNetworkWidget(QWidget):
 
     def expand_widget(self):
         """Expand widget to show network panel"""
-        # Stop hide timer
-        self.hide_timer.stop()
+        # Stop any pending collapse
+        self.cancel_collapse()
 
         # Set expanded state
         self.set_expanded_state()
 
-        # Update responsive fonts
-        self.update_title_font()
-        self.update_label_fonts()
-
         # Position and animate
         self.animate_to_edge()
 
     def collapse_widget(self):
         """Collapse widget to edge"""
-        # Stop all timers
-        self.stop_auto_collapse_timer()
-        self.hover_delay_timer.stop()
+        # Stop pending collapse timer
+        self.cancel_collapse()
 
         # Set collapsed state
         self.set_collapsed_state()
@@ -721,15 +1033,18 @@ class UnifiedNetworkWidget(QWidget):
         # Position and animate
         self.animate_to_edge()
 
-    def update_network_speeds(self):
-        """Update network speed display"""
+    def _on_focus_window_changed(self, window):
+        """Collapse the expanded panel when focus moves to another window"""
+        if self.is_expanded and window is not self.windowHandle():
+            self.collapse_widget()
+
+    def update_network_speeds(self, upload_speed, download_speed):
+        """Update network speed display with speeds emitted by the sampler"""
         if not self.is_expanded or not self.network_monitor:
             return
 
-        upload_speed, download_speed = self.network_monitor.get_network_speed()
-
-        upload_text = self.network_monitor.format_speed(upload_speed)
-        download_text = self.network_monitor.format_speed(download_speed)
+        upload_text = _format_speed(upload_speed)
+        download_text = _format_speed(download_speed)
 
         # Only update if the text has actually changed to prevent unnecessary repaints
         if self.upload_speed_label.text() != upload_text:
@@ -745,10 +1060,6 @@ class UnifiedNetworkWidget(QWidget):
         # Ensure styling is applied immediately after setting expanded state
         self.update_inner_widget_style()
 
-        # Update fonts to match the loaded size
-        self.update_title_font()
-        self.update_label_fonts()
-
         # Calculate final position
         if self.is_on_right:
             final_x = self.screen_width - self.panel_width - 10
@@ -803,11 +1114,12 @@ class UnifiedNetworkWidget(QWidget):
     def closeEvent(self, event):
         """Handle widget close event"""
         self.save_position()
+        self._flush_position()
         super().closeEvent(event)
 
     def update_title_font(self):
         """Update title font size based on widget size"""
-        if not hasattr(self, "title_label"):
+        if not self._ui_ready:
             return  # Label not created yet
 
         # Calculate font size based on widget width, accounting for close button space
@@ -815,58 +1127,83 @@ class UnifiedNetworkWidget(QWidget):
             self.panel_width - 50
         )  # Reserve space for close button and margins
         base_size = max(8, min(14, int(available_width / 18)))
-        title_font = QFont()
-        title_font.setPointSize(base_size)
-        title_font.setBold(True)
-        self.title_label.setFont(title_font)
+        title_key = (base_size, True)
+        if title_key == self._title_font_key:
+            return  # Font already applied
+
+        self.title_label.setFont(self.get_font(*title_key))
+        self._title_font_key = title_key
 
     def update_label_fonts(self):
         """Update label fonts based on widget size"""
-        # Check if all labels exist before updating
-        if not all(
-            hasattr(self, attr)
-            for attr in [
-                "upload_label",
-                "download_label",
-                "upload_speed_label",
-                "download_speed_label",
-            ]
-        ):
+        if not self._ui_ready:
             return  # Labels not created yet
 
         # Calculate font sizes based on widget dimensions
         label_size = max(7, min(12, int(self.panel_width / 25)))
         speed_size = max(10, min(18, int(self.panel_width / 18)))
+        label_key = (label_size, True)
+        speed_key = (speed_size, False)
+        label_changed = label_key != self._label_font_key
+        speed_changed = speed_key != self._speed_font_key
+        if not label_changed and not speed_changed:
+            return  # Fonts already applied
+
+        # Apply only the fonts that changed (batched into a single repaint)
+        self.inner_widget.setUpdatesEnabled(False)
+        try:
+            if label_changed:
+                label_font = self.get_font(*label_key)
+                self.upload_label.setFont(label_font)
+                self.download_label.setFont(label_font)
+                self._label_font_key = label_key
+            if speed_changed:
+                speed_font = self.get_font(*speed_key)
+                self.upload_speed_label.setFont(speed_font)
+                self.download_speed_label.setFont(speed_font)
+                self._speed_font_key = speed_key
+        finally:
+            self.inner_widget.setUpdatesEnabled(True)
+
+    @classmethod
+    def get_font(cls, point_size, bold):
+        """Return a shared QFont for the given size and weight"""
+        key = (point_size, bold)
+        font = cls._font_cache.get(key)
+        if font is None:
+            font = QFont()
+            font.setPointSize(point_size)
+            font.setBold(bold)
+            cls._font_cache[key] = font
+        return font
+
+    def schedule_collapse(self, delay_ms):
+        """Push the collapse deadline delay_ms into the future while expanded"""
+        if not self.is_expanded:
+            return
 
-        # Label font
-        label_font = QFont()
-        label_font.setPointSize(label_size)
-        label_font.setBold(True)
-
-        # Speed font
-        speed_font = QFont()
-        speed_font.setPointSize(speed_size)
-
-        # Apply fonts
-        self.upload_label.setFont(label_font)
-        self.download_label.setFont(label_font)
-        self.upload_speed_label.setFont(speed_font)
-        self.download_speed_label.setFont(speed_font)
-
-    def reset_auto_collapse_timer(self):
-        """Reset the 10-second auto-collapse timer"""
-        if self.is_expanded:
-            self.auto_collapse_timer.stop()
-            self.auto_collapse_timer.start(10000)  # 10 seconds
-
-    def start_auto_collapse_timer(self):
-        """Start the 10-second auto-collapse timer"""
-        if self.is_expanded:
-            self.auto_collapse_timer.start(10000)  # 10 seconds
+        deadline = time.monotonic() + delay_ms / 1000
+        # A later deadline is picked up when the running timer fires, so the
+        # timer only needs (re)starting when idle or when collapsing sooner
+        if not self._collapse_timer.isActive() or deadline < self._collapse_deadline:
+            self._collapse_timer.start(delay_ms)
+        self._collapse_deadline = deadline
+
+    def cancel_collapse(self):
+        """Stop the collapse timer"""
+        self._collapse_timer.stop()
+        self._collapse_deadline = None
+
+    def _on_collapse_timeout(self):
+        """Collapse once the deadline passes, or wait out the remaining time"""
+        if self._collapse_deadline is None:
+            return
 
-    def stop_auto_collapse_timer(self):
-        """Stop the auto-collapse timer"""
-        self.auto_collapse_timer.stop()
+        remaining_ms = int((self._collapse_deadline - time.monotonic()) * 1000)
+        if remaining_ms > 0:
+            self._collapse_timer.start(remaining_ms)
+        else:
+            self.collapse_widget()
 
     def get_resize_cursor_zone(self, pos):
         """Determine which resize zone the mouse is in with accurate cursor indicators"""
@@ -874,127 +1211,118 @@ class UnifiedNetworkWidget(QWidget):
             return None
 
         margin = self.resize_threshold
-        rect = self.rect()
-
-        # Check corners first (for diagonal resize) - more precise detection
-        if pos.x() <= margin and pos.y() <= margin:
-            return Qt.SizeFDiagCursor  # Top-left (↖)
-        elif pos.x() >= rect.width() - margin and pos.y() <= margin:
-            return Qt.SizeBDiagCursor  # Top-right (↗)
-        elif pos.x() <= margin and pos.y() >= rect.height() - margin:
-            return Qt.SizeBDiagCursor  # Bottom-left (↙)
-        elif pos.x() >= rect.width() - margin and pos.y() >= rect.height() - margin:
-            return Qt.SizeFDiagCursor  # Bottom-right (↘)
-
-        # Check edges - with clear directional indicators
-        elif pos.x() <= margin:
-            return Qt.SizeHorCursor  # Left edge (↔)
-        elif pos.x() >= rect.width() - margin:
-            return Qt.SizeHorCursor  # Right edge (↔)
-        elif pos.y() <= margin:
-            return Qt.SizeVerCursor  # Top edge (↕)
-        elif pos.y() >= rect.height() - margin:
-            return Qt.SizeVerCursor  # Bottom edge (↕)
-
-        return None
+        x = pos.x()
+        y = pos.y()
+
+        # Encode edge hits as bits and look the cursor up instead of branching
+        horizontal = (x <= margin) | ((x >= self._zone_right) << 1)
+        vertical = (y <= margin) | ((y >= self._zone_bottom) << 1)
+        return _ZONE_TABLE[horizontal | (vertical << 2)]
+
+    def resizeEvent(self, event):
+        """Cache the right/bottom resize-zone bounds for the new size"""
+        size = event.size()
+        self._zone_right = size.width() - self.resize_threshold
+        self._zone_bottom = size.height() - self.resize_threshold
+        super().resizeEvent(event)
 
     def start_resize(self, pos, cursor_type):
         """Start resizing the widget"""
         self.resizing = True
-        self.resize_start_position = pos
+        self.update_state_bits()
+        self._resize_press_x = pos.x()
+        self._resize_press_y = pos.y()
         self.resize_start_size = self.size()
         self.resize_start_geometry = self.geometry()  # Store initial position too
-        self.resize_cursor_type = cursor_type
-        self.setCursor(QCursor(cursor_type))
-        self.stop_auto_collapse_timer()  # Stop auto-collapse during resize
+        self._resize_anchor = self._get_resize_anchor(pos, cursor_type)
+        self._last_applied_geometry = None
+        self.set_cursor_shape(cursor_type)
+        self.cancel_collapse()  # Stop auto-collapse during resize
+
+    def _get_resize_anchor(self, pos, cursor_type):
+        """Return which edges a resize started at pos moves, e.g. "TL" or "R" """
+        thr = self.resize_threshold
+        start_local_x = pos.x() - self.resize_start_geometry.x()
+        start_local_y = pos.y() - self.resize_start_geometry.y()
+
+        if cursor_type == Qt.SizeHorCursor:
+            # Left or right edge
+            return "L" if start_local_x <= thr else "R"
+        if cursor_type == Qt.SizeVerCursor:
+            # Top or bottom edge
+            return "T" if start_local_y <= thr else "B"
+        if cursor_type == Qt.SizeFDiagCursor:
+            # Top-left or bottom-right corner
+            if start_local_x <= thr and start_local_y <= thr:
+                return "TL"
+            return "BR"
+        if cursor_type == Qt.SizeBDiagCursor:
+            # Top-right or bottom-left corner
+            if (
+                start_local_x >= self.resize_start_size.width() - thr
+                and start_local_y <= thr
+            ):
+                return "TR"
+            return "BL"
+        return ""
 
     def perform_resize(self, pos):
-        """Perform the resize operation with proper directional behavior"""
+        """Perform the resize operation, applying at most one geometry per frame"""
         if not self.resizing:
             return
 
-        delta = pos - self.resize_start_position
-        new_width = self.resize_start_size.width()
-        new_height = self.resize_start_size.height()
-        new_x = self.resize_start_geometry.x()
-        new_y = self.resize_start_geometry.y()
-
-        # Apply resize based on cursor type with proper directional control
-        if self.resize_cursor_type == Qt.SizeHorCursor:
-            # Determine if this is left or right edge
-            rect = self.rect()
-            if (
-                self.resize_start_position.x() - self.resize_start_geometry.x()
-                <= self.resize_threshold
-            ):
-                # Left edge: dragging right decreases width, dragging left increases width
-                new_width = self.resize_start_size.width() - delta.x()
-                new_x = self.resize_start_geometry.x() + delta.x()
-            else:
-                # Right edge: dragging right increases width, dragging left decreases width
-                new_width = self.resize_start_size.width() + delta.x()
-
-        elif self.resize_cursor_type == Qt.SizeVerCursor:
-            # Determine if this is top or bottom edge
-            rect = self.rect()
-            if (
-                self.resize_start_position.y() - self.resize_start_geometry.y()
-                <= self.resize_threshold
-            ):
-                # Top edge: dragging down decreases height, dragging up increases height
-                new_height = self.resize_start_size.height() - delta.y()
-                new_y = self.resize_start_geometry.y() + delta.y()
-            else:
-                # Bottom edge: dragging down increases height, dragging up decreases height
-                new_height = self.resize_start_size.height() + delta.y()
-
-        elif self.resize_cursor_type == Qt.SizeFDiagCursor:
-            # Top-left or bottom-right corner
-            rect = self.rect()
-            start_local_x = (
-                self.resize_start_position.x() - self.resize_start_geometry.x()
-            )
-            start_local_y = (
-                self.resize_start_position.y() - self.resize_start_geometry.y()
-            )
-
-            if (
-                start_local_x <= self.resize_threshold
-                and start_local_y <= self.resize_threshold
-            ):
-                # Top-left corner
-                new_width = self.resize_start_size.width() - delta.x()
-                new_height = self.resize_start_size.height() - delta.y()
-                new_x = self.resize_start_geometry.x() + delta.x()
-                new_y = self.resize_start_geometry.y() + delta.y()
-            else:
-                # Bottom-right corner
-                new_width = self.resize_start_size.width() + delta.x()
-                new_height = self.resize_start_size.height() + delta.y()
+        geometry = self._compute_resize(pos)
 
-        elif self.resize_cursor_type == Qt.SizeBDiagCursor:
-            # Top-right or bottom-left corner
-            rect = self.rect()
-            start_local_x = (
-                self.resize_start_position.x() - self.resize_start_geometry.x()
-            )
-            start_local_y = (
-                self.resize_start_position.y() - self.resize_start_geometry.y()
-            )
+        # Dragging past a size limit leaves the geometry unchanged - skip it
+        if geometry == self._last_applied_geometry:
+            self._pending_geometry = None
+            return
 
-            if (
-                start_local_x >= rect.width() - self.resize_threshold
-                and start_local_y <= self.resize_threshold
-            ):
-                # Top-right corner
-                new_width = self.resize_start_size.width() + delta.x()
-                new_height = self.resize_start_size.height() - delta.y()
-                new_y = self.resize_start_geometry.y() + delta.y()
-            else:
-                # Bottom-left corner
-                new_width = self.resize_start_size.width() - delta.x()
-                new_height = self.resize_start_size.height() + delta.y()
-                new_x = self.resize_start_geometry.x() + delta.x()
+        self._pending_geometry = geometry
+
+        # Leading edge: apply right away, then coalesce until the throttle fires
+        if not self._resize_throttle.isActive():
+            self._apply_resize()
+            self._resize_throttle.start()
+
+    def _flush_pending_resize(self):
+        """Apply the latest resize geometry queued while throttled"""
+        if self._pending_geometry is not None:
+            self._apply_resize()
+            self._resize_throttle.start()
+
+    def _compute_resize(self, pos):
+        """Compute the (x, y, width, height) for a resize to pos"""
+        dx = pos.x() - self._resize_press_x
+        dy = pos.y() - self._resize_press_y
+
+        # Start geometry is constant for the whole drag - read it once
+        sx = self.resize_start_geometry.x()
+        sy = self.resize_start_geometry.y()
+        sw = self.resize_start_size.width()
+        sh = self.resize_start_size.height()
+        anchor = self._resize_anchor
+
+        new_width = sw
+        new_height = sh
+        new_x = sx
+        new_y = sy
+
+        # Left edge: dragging right decreases width, dragging left increases width
+        # Right edge: dragging right increases width, dragging left decreases width
+        if "L" in anchor:
+            new_width = sw - dx
+            new_x = sx + dx
+        elif "R" in anchor:
+            new_width = sw + dx
+
+        # Top edge: dragging down decreases height, dragging up increases height
+        # Bottom edge: dragging down increases height, dragging up decreases height
+        if "T" in anchor:
+            new_height = sh - dy
+            new_y = sy + dy
+        elif "B" in anchor:
+            new_height = sh + dy
 
         # Apply size constraints
         constrained_width = max(
@@ -1005,31 +1333,46 @@ class UnifiedNetworkWidget(QWidget):
         )
 
         # Adjust position if size was constrained (for left/top edges)
-        if new_width != constrained_width and new_x != self.resize_start_geometry.x():
-            new_x = self.resize_start_geometry.x() + (
-                self.resize_start_size.width() - constrained_width
-            )
-        if new_height != constrained_height and new_y != self.resize_start_geometry.y():
-            new_y = self.resize_start_geometry.y() + (
-                self.resize_start_size.height() - constrained_height
-            )
+        if new_width != constrained_width and new_x != sx:
+            new_x = sx + (sw - constrained_width)
+        if new_height != constrained_height and new_y != sy:
+            new_y = sy + (sh - constrained_height)
+
+        return new_x, new_y, constrained_width, constrained_height
+
+    def _apply_resize(self):
+        """Apply the pending resize geometry and responsive fonts"""
+        new_x, new_y, width, height = self._pending_geometry
+        self._last_applied_geometry = self._pending_geometry
+        self._pending_geometry = None
 
         # Update panel dimensions
-        self.panel_width = constrained_width
-        self.panel_height = constrained_height
+        self.panel_width = width
+        self.panel_height = height
 
-        # Update widget geometry (position and size)
-        self.setGeometry(new_x, new_y, constrained_width, constrained_height)
+        # Geometry and font changes are batched into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            # Update widget geometry (position and size)
+            self.setGeometry(new_x, new_y, width, height)
 
-        # Update font sizes for responsiveness
-        self.update_title_font()
-        self.update_label_fonts()
+            # Update font sizes for responsiveness
+            self.update_title_font()
+            self.update_label_fonts()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def finish_resize(self):
         """Finish the resize operation"""
         if self.resizing:
+            # Apply the last throttled step so the final size isn't dropped
+            self._resize_throttle.stop()
+            if self._pending_geometry is not None:
+                self._apply_resize()
+
             self.resizing = False
-            self.setCursor(QCursor(Qt.PointingHandCursor))
+            self.update_state_bits()
+            self.set_cursor_shape(Qt.PointingHandCursor)
 
             # Ensure widget is in fixed size mode with final dimensions
             self.setFixedSize(self.panel_width, self.panel_height)
@@ -1038,89 +1381,45 @@ class UnifiedNetworkWidget(QWidget):
 
     def enterEvent(self, event):
         """Handle mouse enter events to expand the widget"""
-        # Stop any pending collapse timer
-        self.hover_delay_timer.stop()
-
-        # Only expand if hover expand is enabled, not already expanded, and not in middle of operations
-        if (
-            self.hover_expand_enabled
-            and not self.is_expanded
-            and not self.dragging
-            and not self.resizing
-        ):
-            self.expand_widget()
-        super().enterEvent(event)
+        # Entering only matters when hover expand is enabled
+        state = self._state_bits
+        if state & _HOVER_ENABLED:
+            # Stop any pending hover collapse
+            if self._collapse_timer.isActive():
+                self.cancel_collapse()
+
+            # Only expand if not already expanded and not in middle of operations
+            if (state & _STATE_MASK) == _HOVER_ENABLED:
+                self.expand_widget()
+
+        # Single exit so the base handler runs exactly once per event
+        return super().enterEvent(event)
 
     def leaveEvent(self, event):
         """Handle mouse leave events to start collapse timer"""
-        # Only auto-collapse if hover expand is enabled
-        if (
-            self.hover_expand_enabled
-            and self.is_expanded
-            and not self.dragging
-            and not self.resizing
-        ):
-            self.hover_delay_timer.start(10000)  # 10 seconds delay
-        super().leaveEvent(event)
+        # Only auto-collapse if hover expand is enabled, expanded and idle
+        if (self._state_bits & _STATE_MASK) == _HOVER_ENABLED | _EXPANDED:
+            self.schedule_collapse(10000)  # 10 seconds delay
+
+        # Single exit so the base handler runs exactly once per event
+        return super().leaveEvent(event)
 
     def close_button_clicked(self, event):
         """Handle close button click - terminate the application"""
         self.save_position()
-        QApplication.instance().quit()
+        self._app.quit()
 
     def update_inner_widget_style(self):
         """Update inner widget style based on expanded state and edge position"""
-        if self.is_expanded:
-            # Expanded panel - edge-specific rounding with solid background
-            if self.is_on_right:
-                # Right edge: round left corners, square right corners
-                border_radius = "border-top-left-radius: 12px; border-bottom-left-radius: 12px; border-top-right-radius: 0px; border-bottom-right-radius: 0px;"
-            else:
-                # Left edge: round right corners, square left corners
-                border_radius = "border-top-right-radius: 12px; border-bottom-right-radius: 12px; border-top-left-radius: 0px; border-bottom-left-radius: 0px;"
-
-            # Apply solid background style for expanded state
-            self.inner_widget.setStyleSheet(
-                f"""
-                QWidget#inner_widget {{
-                    background-color: rgb(55, 55, 55);
-                    border: 2px solid rgb(100, 100, 100);
-                    {border_radius}
-                }}
-                QWidget#inner_widget:hover {{
-                    background-color: rgb(70, 70, 70);
-                }}
-                QLabel {{
-                    color: #C0C0C0;
-                    background-color: transparent;
-                }}
-                QFrame {{
-                    color: rgba(120, 120, 120, 150);
-                }}
-            """
-            )
-        else:
-            # Collapsed widget - transparent background with border, dots and border same color
-            self.inner_widget.setStyleSheet(
-                """
-                QWidget#inner_widget {
-                    background-color: transparent;
-                    border: 1px solid rgba(120, 120, 120, 180);
-                    border-radius: 6px;
-                }
-                QLabel {
-                    color: #C0C0C0;
-                    background-color: transparent;
-                }
-                QFrame {
-                    color: rgba(120, 120, 120, 150);
-                }
-            """
-            )
+        qss = self._STYLES[(self.is_expanded, self.is_on_right)]
 
-        # Force immediate style update
-        self.inner_widget.style().polish(self.inner_widget)
-        self.inner_widget.update()
+        # Qt re-parses and re-polishes even an identical stylesheet, so skip it
+        if qss is self._last_qss:
+            return
+
+        # setStyleSheet re-polishes and schedules a repaint on its own
+        self.inner_widget.setStyleSheet(qss)
+        self._last_qss = qss
 
     def update_toggle_button_style(self):
         """Update toggle button style based on hover expand state"""
@@ -1154,6 +1453,7 @@ class UnifiedNetworkWidget(QWidget):
     def toggle_hover_expand(self, event):
         """Toggle the hover expand functionality"""
         self.hover_expand_enabled = not self.hover_expand_enabled
+        self.update_state_bits()
         self.update_toggle_button_style()
 
         # Save the preference
@@ -1169,10 +1469,6 @@ class NetworkMonitorApp(QApplication):
         # Create unified widget
         self.network_widget = UnifiedNetworkWidget()
 
-        # Create and install global click filter
-        self.click_filter = GlobalClickFilter(self.network_widget)
-        self.installEventFilter(self.click_filter)
-
         # Setup system tray (optional)
         self.setup_system_tray()
 
@@ -1180,30 +1476,45 @@ class NetworkMonitorApp(QApplication):
         self.network_widget.show()
 
     def setup_system_tray(self):
-        """Setup system tray icon"""
+        """Setup system tray icon (its menu is built on first interaction)"""
         if not QSystemTrayIcon.isSystemTrayAvailable():
             return
 
         self.tray_icon = QSystemTrayIcon(self)
         self.tray_icon.setIcon(self.style().standardIcon(self.style().SP_ComputerIcon))
+        self.tray_menu = None
+        self.tray_icon.activated.connect(self.on_tray_activated)
+        self.tray_icon.show()
+
+        # Show message once startup and the first paint are out of the way
+        QTimer.singleShot(2000, Qt.CoarseTimer, self.show_tray_message)
+
+    def on_tray_activated(self, reason):
+        """Build the tray menu the first time the tray icon is used"""
+        if self.tray_menu is not None:
+            return
 
         # Create tray menu
-        tray_menu = QMenu()
+        self.tray_menu = QMenu()
 
         show_action = QAction("Show Monitor", self)
         show_action.triggered.connect(self.show_monitor)
-        tray_menu.addAction(show_action)
+        self.tray_menu.addAction(show_action)
 
-        tray_menu.addSeparator()
+        self.tray_menu.addSeparator()
 
         quit_action = QAction("Exit", self)
         quit_action.triggered.connect(self.quit_application)
-        tray_menu.addAction(quit_action)
+        self.tray_menu.addAction(quit_action)
 
-        self.tray_icon.setContextMenu(tray_menu)
-        self.tray_icon.show()
+        self.tray_icon.setContextMenu(self.tray_menu)
+
+        # The right-click that triggered this found no menu yet - show it now
+        if reason == QSystemTrayIcon.Context:
+            self.tray_menu.popup(QCursor.pos())
 
-        # Show message
+    def show_tray_message(self):
+        """Show the startup tray notification"""
         self.tray_icon.showMessage(
             "Network Monitor",
             "Network speed monitor is running. Hover to expand, use × button to close.",